@@ -19,6 +19,44 @@ from .run import *
 __all__ = ["Platform", "TemplatedPlatform"]
 
 
+def _options(opts):
+    if isinstance(opts, str):
+        return opts
+    else:
+        return " ".join(opts)
+
+
+@jinja2.pass_context
+def _hierarchy(context, signal, separator):
+    return separator.join(context["platform"]._name_map[signal][1:])
+
+
+def _ascii_escape(string):
+    def escape_one(match):
+        if match.group(1) is None:
+            return match.group(2)
+        else:
+            return f"_{ord(match.group(1)[0]):02x}_"
+    return "".join(escape_one(m) for m in re.finditer(r"([^A-Za-z0-9_])|(.)", string))
+
+
+def _tcl_escape(string):
+    return "{" + re.sub(r"([{}\\])", r"\\\1", string) + "}"
+
+
+def _tcl_quote(string):
+    return '"' + re.sub(r"([$[\\])", r"\\\1", string) + '"'
+
+
+_template_env = jinja2.Environment(
+    trim_blocks=True, lstrip_blocks=True, undefined=jinja2.StrictUndefined)
+_template_env.filters["options"] = _options
+_template_env.filters["hierarchy"] = _hierarchy
+_template_env.filters["ascii_escape"] = _ascii_escape
+_template_env.filters["tcl_escape"] = _tcl_escape
+_template_env.filters["tcl_quote"] = _tcl_quote
+
+
 class Platform(ResourceManager, metaclass=ABCMeta):
     resources      = property(abstractmethod(lambda: None))
     connectors     = property(abstractmethod(lambda: None))
@@ -294,6 +332,24 @@ class TemplatedPlatform(Platform):
         """,
     }
 
+    # Template sources are constant, and everything a template refers to is passed in the render
+    # context, so the compiled templates can be shared between all platforms and builds.
+    _template_cache = {}
+
+    @classmethod
+    def _compile_template(cls, source, origin):
+        try:
+            return cls._template_cache[source]
+        except KeyError:
+            pass
+        try:
+            compiled = _template_env.from_string(textwrap.dedent(source).strip())
+        except jinja2.TemplateSyntaxError as e:
+            e.args = (f"{e.message} (at {origin}:{e.lineno})",)
+            raise
+        cls._template_cache[source] = compiled
+        return compiled
+
     def iter_clock_constraints(self):
         for net_signal, port_signal, frequency in super().iter_clock_constraints():
             # Skip any clock constraints placed on signals that are never used in the design.
@@ -416,29 +472,6 @@ class TemplatedPlatform(Platform):
             else:
                 assert False
 
-        def options(opts):
-            if isinstance(opts, str):
-                return opts
-            else:
-                return " ".join(opts)
-
-        def hierarchy(signal, separator):
-            return separator.join(self._name_map[signal][1:])
-
-        def ascii_escape(string):
-            def escape_one(match):
-                if match.group(1) is None:
-                    return match.group(2)
-                else:
-                    return f"_{ord(match.group(1)[0]):02x}_"
-            return "".join(escape_one(m) for m in re.finditer(r"([^A-Za-z0-9_])|(.)", string))
-
-        def tcl_escape(string):
-            return "{" + re.sub(r"([{}\\])", r"\\\1", string) + "}"
-
-        def tcl_quote(string):
-            return '"' + re.sub(r"([$[\\])", r"\\\1", string) + '"'
-
         def verbose(arg):
             if get_override_flag("verbose"):
                 return arg
@@ -452,18 +485,7 @@ class TemplatedPlatform(Platform):
                 return arg
 
         def render(source, origin, syntax=None):
-            try:
-                source   = textwrap.dedent(source).strip()
-                compiled = jinja2.Template(source,
-                    trim_blocks=True, lstrip_blocks=True, undefined=jinja2.StrictUndefined)
-                compiled.environment.filters["options"] = options
-                compiled.environment.filters["hierarchy"] = hierarchy
-                compiled.environment.filters["ascii_escape"] = ascii_escape
-                compiled.environment.filters["tcl_escape"] = tcl_escape
-                compiled.environment.filters["tcl_quote"] = tcl_quote
-            except jinja2.TemplateSyntaxError as e:
-                e.args = (f"{e.message} (at {origin}:{e.lineno})",)
-                raise
+            compiled = self._compile_template(source, origin)
             return compiled.render({
                 "name": name,
                 "platform": self,
@@ -31,6 +31,9 @@ class ResourceManager:
         self._ports     = []
         self._clocks    = SignalDict()
 
+        # Computed on first use, and discarded whenever a port is added.
+        self._port_constraints_bits = None
+
         self.add_resources(resources)
         self.add_connectors(connectors)
 
@@ -167,6 +170,7 @@ class ResourceManager:
                     self._phys_reqd[phys_name] = name
 
                 self._ports.append((resource, pin, port, attrs))
+                self._port_constraints_bits = None
 
                 if pin is not None and resource.clock is not None:
                     self.add_clock_constraint(pin.i, resource.clock.frequency)
@@ -227,12 +231,18 @@ class ResourceManager:
                 assert False
 
     def iter_port_constraints_bits(self):
-        for port_name, pin_names, attrs in self.iter_port_constraints():
-            if len(pin_names) == 1:
-                yield port_name, pin_names[0], attrs
-            else:
-                for bit, pin_name in enumerate(pin_names):
-                    yield f"{port_name}[{bit}]", pin_name, attrs
+        # Toolchain templates often iterate over these more than once per build, e.g. once for
+        # the pin assignments and once for the I/O standards.
+        if self._port_constraints_bits is None:
+            port_constraints_bits = []
+            for port_name, pin_names, attrs in self.iter_port_constraints():
+                if len(pin_names) == 1:
+                    port_constraints_bits.append((port_name, pin_names[0], attrs))
+                else:
+                    for bit, pin_name in enumerate(pin_names):
+                        port_constraints_bits.append((f"{port_name}[{bit}]", pin_name, attrs))
+            self._port_constraints_bits = port_constraints_bits
+        yield from self._port_constraints_bits
 
     def add_clock_constraint(self, clock, frequency):
         if not isinstance(clock, Signal):
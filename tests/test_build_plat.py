@@ -1,3 +1,5 @@
+import jinja2
+
 from amaranth import *
 from amaranth.build.plat import *
 
@@ -62,3 +64,34 @@ class PlatformTestCase(FHDLTestCase):
                          ["baz.vhd"])
         self.assertEqual(list(self.platform.iter_files(".v", ".vhd")),
                          ["foo.v", "bar.v", "baz.vhd"])
+
+
+class MockTemplatedPlatform(TemplatedPlatform):
+    resources  = []
+    connectors = []
+
+    toolchain = "Mock"
+    required_tools = []
+
+    file_templates = {
+        "{{name}}.txt": r"""
+            {{platform.toolchain|tcl_escape}}
+        """,
+    }
+    command_templates = []
+
+
+class TemplatedPlatformTestCase(FHDLTestCase):
+    def test_template_cache(self):
+        plan1 = MockTemplatedPlatform().prepare(Module(), "top")
+        plan2 = MockTemplatedPlatform().prepare(Module(), "top")
+        self.assertEqual(plan1.files["top.txt"], "{Mock}")
+        self.assertEqual(plan2.files["top.txt"], "{Mock}")
+        source = MockTemplatedPlatform.file_templates["{{name}}.txt"]
+        self.assertIs(TemplatedPlatform._compile_template(source, origin="a"),
+                      TemplatedPlatform._compile_template(source, origin="b"))
+
+    def test_template_syntax_error(self):
+        with self.assertRaisesRegex(jinja2.TemplateSyntaxError,
+                r"^Expected an expression, got 'end of print statement' \(at <test>:1\)$"):
+            TemplatedPlatform._compile_template("{{}}", origin="<test>")
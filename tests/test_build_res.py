@@ -130,6 +130,24 @@ class ResourceManagerTestCase(FHDLTestCase):
             ("clk100_0__n", ["H2"], {}),
         ])
 
+    def test_iter_port_constraints_bits(self):
+        self.cm.add_resources([
+            Resource("user_btn", 0, Pins("C0 C1", dir="i")),
+        ])
+        self.cm.request("user_led", 0)
+        self.assertEqual(list(self.cm.iter_port_constraints_bits()), [
+            ("user_led_0__io", "A0", {}),
+        ])
+        self.assertEqual(list(self.cm.iter_port_constraints_bits()), [
+            ("user_led_0__io", "A0", {}),
+        ])
+        self.cm.request("user_btn", 0)
+        self.assertEqual(list(self.cm.iter_port_constraints_bits()), [
+            ("user_led_0__io", "A0", {}),
+            ("user_btn_0__io[0]", "C0", {}),
+            ("user_btn_0__io[1]", "C1", {}),
+        ])
+
     def test_request_inverted(self):
         new_resources = [
             Resource("cs", 0, PinsN("X0")),